@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core instead of the stdlib json module.
+
+    Content coming from a response_model is already serialized to JSON-compatible
+    data by pydantic, so only the final encoding step changes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
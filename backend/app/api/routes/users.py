@@ -1,8 +1,12 @@
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import col, delete, func, select
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import Connection, Engine
+from sqlmodel import Session, col, delete, func, select
 
 from app import crud
 from app.api.deps import (
@@ -10,6 +14,7 @@ from app.api.deps import (
     SessionDep,
     get_current_active_superuser,
 )
+from app.api.responses import PydanticJSONResponse
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.models import (
@@ -33,6 +38,7 @@ router = APIRouter(prefix="/users", tags=["users"])
     "/",
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
+    response_class=PydanticJSONResponse,
 )
 def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     """
@@ -48,6 +54,29 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     return UsersPublic(data=users, count=count)
 
 
+def iter_users_ndjson(bind: Engine | Connection) -> Iterator[bytes]:
+    # The request session is closed before a streaming body is sent, so rows
+    # are read through a session of their own on the same bind
+    with Session(bind) as session:
+        statement = select(User).execution_options(yield_per=100)
+        for user in session.exec(statement):
+            yield to_json(UserPublic.model_validate(user)) + b"\n"
+
+
+@router.get(
+    "/export",
+    dependencies=[Depends(get_current_active_superuser)],
+    response_class=StreamingResponse,
+)
+def export_users(session: SessionDep) -> StreamingResponse:
+    """
+    Stream all users as newline-delimited JSON, one UserPublic per line.
+    """
+    return StreamingResponse(
+        iter_users_ndjson(session.get_bind()), media_type="application/x-ndjson"
+    )
+
+
 @router.post(
     "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
 )
@@ -1,11 +1,15 @@
 import uuid
 from typing import Any
 
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from app.core.security import get_password_hash, verify_password
 from app.models import Item, ItemCreate, User, UserCreate, UserUpdate, Product, ProductCreate, ProductUpdate
 
+# Built once at import; the email is bound per call
+user_by_email_statement = select(User).where(User.email == bindparam("email"))
+
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
     db_obj = User.model_validate(
@@ -49,8 +53,9 @@ def update_product(*, session: Session, db_product: Product, product_in: Product
 
 
 def get_user_by_email(*, session: Session, email: str) -> User | None:
-    statement = select(User).where(User.email == email)
-    session_user = session.exec(statement).first()
+    session_user = session.exec(
+        user_by_email_statement, params={"email": email}
+    ).first()
     return session_user
 
 
@@ -169,7 +169,7 @@ class Token(SQLModel):
 
 # Contents of JWT token
 class TokenPayload(SQLModel):
-    sub: Optional[str] = None
+    sub: Optional[uuid.UUID] = None
 
 
 class NewPassword(SQLModel):
@@ -1,10 +1,18 @@
 import uuid
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.core.config import settings
+from app.models import Item
+from app.tests.utils.bulk import bulk_insert
 from app.tests.utils.item import create_random_item
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import MISSING_ID, random_lower_string
+
+UPDATE_DATA = {"title": "Updated title", "description": "Updated description"}
+ITEMS_URL = f"{settings.API_V1_STR}/items/"
 
 
 def test_create_item(
@@ -12,7 +20,7 @@ def test_create_item(
 ) -> None:
     data = {"title": "Foo", "description": "Fighters"}
     response = client.post(
-        f"{settings.API_V1_STR}/items/",
+        ITEMS_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -29,7 +37,7 @@ def test_read_item(
 ) -> None:
     item = create_random_item(db)
     response = client.get(
-        f"{settings.API_V1_STR}/items/{item.id}",
+        f"{ITEMS_URL}{item.id}",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -40,25 +48,44 @@ def test_read_item(
     assert content["owner_id"] == str(item.owner_id)
 
 
-def test_read_item_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
+@pytest.mark.parametrize(
+    "method, data",
+    [("GET", None), ("PUT", UPDATE_DATA), ("DELETE", None)],
+)
+def test_item_not_found(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    method: str,
+    data: dict[str, str] | None,
 ) -> None:
-    response = client.get(
-        f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
+    response = client.request(
+        method,
+        f"{ITEMS_URL}{MISSING_ID}",
         headers=superuser_token_headers,
+        json=data,
     )
     assert response.status_code == 404
     content = response.json()
     assert content["detail"] == "Item not found"
 
 
-def test_read_item_not_enough_permissions(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+@pytest.mark.parametrize(
+    "method, data",
+    [("GET", None), ("PUT", UPDATE_DATA), ("DELETE", None)],
+)
+def test_item_not_enough_permissions(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    db: Session,
+    method: str,
+    data: dict[str, str] | None,
 ) -> None:
     item = create_random_item(db)
-    response = client.get(
-        f"{settings.API_V1_STR}/items/{item.id}",
+    response = client.request(
+        method,
+        f"{ITEMS_URL}{item.id}",
         headers=normal_user_token_headers,
+        json=data,
     )
     assert response.status_code == 400
     content = response.json()
@@ -68,10 +95,19 @@ def test_read_item_not_enough_permissions(
 def test_read_items(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    create_random_item(db)
-    create_random_item(db)
+    user = create_random_user(db)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": random_lower_string(),
+            "description": random_lower_string(),
+            "owner_id": user.id,
+        }
+        for _ in range(2)
+    ]
+    bulk_insert(db, Item, rows)
     response = client.get(
-        f"{settings.API_V1_STR}/items/",
+        ITEMS_URL,
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -85,7 +121,7 @@ def test_update_item(
     item = create_random_item(db)
     data = {"title": "Updated title", "description": "Updated description"}
     response = client.put(
-        f"{settings.API_V1_STR}/items/{item.id}",
+        f"{ITEMS_URL}{item.id}",
         headers=superuser_token_headers,
         json=data,
     )
@@ -97,68 +133,14 @@ def test_update_item(
     assert content["owner_id"] == str(item.owner_id)
 
 
-def test_update_item_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-) -> None:
-    data = {"title": "Updated title", "description": "Updated description"}
-    response = client.put(
-        f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-        headers=superuser_token_headers,
-        json=data,
-    )
-    assert response.status_code == 404
-    content = response.json()
-    assert content["detail"] == "Item not found"
-
-
-def test_update_item_not_enough_permissions(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
-) -> None:
-    item = create_random_item(db)
-    data = {"title": "Updated title", "description": "Updated description"}
-    response = client.put(
-        f"{settings.API_V1_STR}/items/{item.id}",
-        headers=normal_user_token_headers,
-        json=data,
-    )
-    assert response.status_code == 400
-    content = response.json()
-    assert content["detail"] == "Not enough permissions"
-
-
 def test_delete_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
     item = create_random_item(db)
     response = client.delete(
-        f"{settings.API_V1_STR}/items/{item.id}",
+        f"{ITEMS_URL}{item.id}",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
     content = response.json()
     assert content["message"] == "Item deleted successfully"
-
-
-def test_delete_item_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-) -> None:
-    response = client.delete(
-        f"{settings.API_V1_STR}/items/{uuid.uuid4()}",
-        headers=superuser_token_headers,
-    )
-    assert response.status_code == 404
-    content = response.json()
-    assert content["detail"] == "Item not found"
-
-
-def test_delete_item_not_enough_permissions(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
-) -> None:
-    item = create_random_item(db)
-    response = client.delete(
-        f"{settings.API_V1_STR}/items/{item.id}",
-        headers=normal_user_token_headers,
-    )
-    assert response.status_code == 400
-    content = response.json()
-    assert content["detail"] == "Not enough permissions"
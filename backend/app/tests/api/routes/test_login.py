@@ -1,20 +1,26 @@
+from datetime import timedelta
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.core.security import verify_password
+from app.core.security import create_access_token, verify_password
 from app.models import User
+from app.tests.utils.utils import LOGIN_ACCESS_TOKEN_URL
 from app.utils import generate_password_reset_token
 
+LOGIN_TEST_TOKEN_URL = f"{settings.API_V1_STR}/login/test-token"
+PASSWORD_RECOVERY_URL = f"{settings.API_V1_STR}/password-recovery/"
+RESET_PASSWORD_URL = f"{settings.API_V1_STR}/reset-password/"
+
 
 def test_get_access_token(client: TestClient) -> None:
     login_data = {
         "username": settings.FIRST_SUPERUSER,
         "password": settings.FIRST_SUPERUSER_PASSWORD,
     }
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+    r = client.post(LOGIN_ACCESS_TOKEN_URL, data=login_data)
     tokens = r.json()
     assert r.status_code == 200
     assert "access_token" in tokens
@@ -26,7 +32,7 @@ def test_get_access_token_incorrect_password(client: TestClient) -> None:
         "username": settings.FIRST_SUPERUSER,
         "password": "incorrect",
     }
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+    r = client.post(LOGIN_ACCESS_TOKEN_URL, data=login_data)
     assert r.status_code == 400
 
 
@@ -34,7 +40,7 @@ def test_use_access_token(
     client: TestClient, superuser_token_headers: dict[str, str]
 ) -> None:
     r = client.post(
-        f"{settings.API_V1_STR}/login/test-token",
+        LOGIN_TEST_TOKEN_URL,
         headers=superuser_token_headers,
     )
     result = r.json()
@@ -42,6 +48,16 @@ def test_use_access_token(
     assert "email" in result
 
 
+def test_use_access_token_invalid_subject(client: TestClient) -> None:
+    token = create_access_token("not-a-uuid", expires_delta=timedelta(minutes=5))
+    r = client.post(
+        LOGIN_TEST_TOKEN_URL,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert r.status_code == 403
+    assert r.json()["detail"] == "Could not validate credentials"
+
+
 def test_recovery_password(
     client: TestClient, normal_user_token_headers: dict[str, str]
 ) -> None:
@@ -51,7 +67,7 @@ def test_recovery_password(
     ):
         email = "test@example.com"
         r = client.post(
-            f"{settings.API_V1_STR}/password-recovery/{email}",
+            f"{PASSWORD_RECOVERY_URL}{email}",
             headers=normal_user_token_headers,
         )
         assert r.status_code == 200
@@ -63,7 +79,7 @@ def test_recovery_password_user_not_exits(
 ) -> None:
     email = "jVgQr@example.com"
     r = client.post(
-        f"{settings.API_V1_STR}/password-recovery/{email}",
+        f"{PASSWORD_RECOVERY_URL}{email}",
         headers=normal_user_token_headers,
     )
     assert r.status_code == 404
@@ -75,7 +91,7 @@ def test_reset_password(
     token = generate_password_reset_token(email=settings.FIRST_SUPERUSER)
     data = {"new_password": "changethis", "token": token}
     r = client.post(
-        f"{settings.API_V1_STR}/reset-password/",
+        RESET_PASSWORD_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -93,7 +109,7 @@ def test_reset_password_invalid_token(
 ) -> None:
     data = {"new_password": "changethis", "token": "invalid"}
     r = client.post(
-        f"{settings.API_V1_STR}/reset-password/",
+        RESET_PASSWORD_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -1,13 +1,17 @@
+import uuid
+
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from app.core.config import settings
 from app.models import User
 
+PRIVATE_USERS_URL = f"{settings.API_V1_STR}/private/users/"
+
 
 def test_create_user(client: TestClient, db: Session) -> None:
     r = client.post(
-        f"{settings.API_V1_STR}/private/users/",
+        PRIVATE_USERS_URL,
         json={
             "email": "pollo@listo.com",
             "password": "password123",
@@ -19,7 +23,7 @@ def test_create_user(client: TestClient, db: Session) -> None:
 
     data = r.json()
 
-    user = db.exec(select(User).where(User.id == data["id"])).first()
+    user = db.exec(select(User).where(User.id == uuid.UUID(data["id"]))).first()
 
     assert user
     assert user.email == "pollo@listo.com"
@@ -1,4 +1,4 @@
-import uuid
+import json
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
@@ -8,13 +8,20 @@ from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
 from app.models import User, UserCreate
-from app.tests.utils.utils import random_email, random_lower_string
+from app.tests.utils.user import create_users, user_token_headers
+from app.tests.utils.utils import MISSING_ID, random_email, random_lower_string
+
+USERS_URL = f"{settings.API_V1_STR}/users/"
+USERS_ME_URL = f"{settings.API_V1_STR}/users/me"
+USERS_ME_PASSWORD_URL = f"{settings.API_V1_STR}/users/me/password"
+USERS_SIGNUP_URL = f"{settings.API_V1_STR}/users/signup"
+USERS_EXPORT_URL = f"{settings.API_V1_STR}/users/export"
 
 
 def test_get_users_superuser_me(
     client: TestClient, superuser_token_headers: dict[str, str]
 ) -> None:
-    r = client.get(f"{settings.API_V1_STR}/users/me", headers=superuser_token_headers)
+    r = client.get(USERS_ME_URL, headers=superuser_token_headers)
     current_user = r.json()
     assert current_user
     assert current_user["is_active"] is True
@@ -25,7 +32,7 @@ def test_get_users_superuser_me(
 def test_get_users_normal_user_me(
     client: TestClient, normal_user_token_headers: dict[str, str]
 ) -> None:
-    r = client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+    r = client.get(USERS_ME_URL, headers=normal_user_token_headers)
     current_user = r.json()
     assert current_user
     assert current_user["is_active"] is True
@@ -45,7 +52,7 @@ def test_create_user_new_email(
         password = random_lower_string()
         data = {"email": username, "password": password}
         r = client.post(
-            f"{settings.API_V1_STR}/users/",
+            USERS_URL,
             headers=superuser_token_headers,
             json=data,
         )
@@ -65,7 +72,7 @@ def test_get_existing_user(
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
     r = client.get(
-        f"{settings.API_V1_STR}/users/{user_id}",
+        f"{USERS_URL}{user_id}",
         headers=superuser_token_headers,
     )
     assert 200 <= r.status_code < 300
@@ -82,17 +89,10 @@ def test_get_existing_user_current_user(client: TestClient, db: Session) -> None
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
 
-    login_data = {
-        "username": username,
-        "password": password,
-    }
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
-    tokens = r.json()
-    a_token = tokens["access_token"]
-    headers = {"Authorization": f"Bearer {a_token}"}
+    headers = user_token_headers(user_id=user_id)
 
     r = client.get(
-        f"{settings.API_V1_STR}/users/{user_id}",
+        f"{USERS_URL}{user_id}",
         headers=headers,
     )
     assert 200 <= r.status_code < 300
@@ -106,7 +106,7 @@ def test_get_existing_user_permissions_error(
     client: TestClient, normal_user_token_headers: dict[str, str]
 ) -> None:
     r = client.get(
-        f"{settings.API_V1_STR}/users/{uuid.uuid4()}",
+        f"{USERS_URL}{MISSING_ID}",
         headers=normal_user_token_headers,
     )
     assert r.status_code == 403
@@ -123,7 +123,7 @@ def test_create_user_existing_username(
     crud.create_user(session=db, user_create=user_in)
     data = {"email": username, "password": password}
     r = client.post(
-        f"{settings.API_V1_STR}/users/",
+        USERS_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -139,7 +139,7 @@ def test_create_user_by_normal_user(
     password = random_lower_string()
     data = {"email": username, "password": password}
     r = client.post(
-        f"{settings.API_V1_STR}/users/",
+        USERS_URL,
         headers=normal_user_token_headers,
         json=data,
     )
@@ -149,17 +149,13 @@ def test_create_user_by_normal_user(
 def test_retrieve_users(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    username = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=username, password=password)
-    crud.create_user(session=db, user_create=user_in)
-
-    username2 = random_email()
-    password2 = random_lower_string()
-    user_in2 = UserCreate(email=username2, password=password2)
-    crud.create_user(session=db, user_create=user_in2)
+    users_in = [
+        UserCreate(email=random_email(), password=random_lower_string())
+        for _ in range(2)
+    ]
+    create_users(db, users_in)
 
-    r = client.get(f"{settings.API_V1_STR}/users/", headers=superuser_token_headers)
+    r = client.get(USERS_URL, headers=superuser_token_headers)
     all_users = r.json()
 
     assert len(all_users["data"]) > 1
@@ -168,6 +164,33 @@ def test_retrieve_users(
         assert "email" in item
 
 
+def test_export_users(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    username = random_email()
+    password = random_lower_string()
+    user_in = UserCreate(email=username, password=password)
+    crud.create_user(session=db, user_create=user_in)
+
+    r = client.get(USERS_EXPORT_URL, headers=superuser_token_headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    users = [json.loads(line) for line in r.text.splitlines()]
+    emails = {user["email"] for user in users}
+    assert settings.FIRST_SUPERUSER in emails
+    assert username in emails
+    for user in users:
+        assert "id" in user
+        assert "hashed_password" not in user
+
+
+def test_export_users_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(USERS_EXPORT_URL, headers=normal_user_token_headers)
+    assert r.status_code == 403
+
+
 def test_update_user_me(
     client: TestClient, normal_user_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -175,7 +198,7 @@ def test_update_user_me(
     email = random_email()
     data = {"full_name": full_name, "email": email}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me",
+        USERS_ME_URL,
         headers=normal_user_token_headers,
         json=data,
     )
@@ -200,7 +223,7 @@ def test_update_password_me(
         "new_password": new_password,
     }
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me/password",
+        USERS_ME_PASSWORD_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -220,7 +243,7 @@ def test_update_password_me(
         "new_password": settings.FIRST_SUPERUSER_PASSWORD,
     }
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me/password",
+        USERS_ME_PASSWORD_URL,
         headers=superuser_token_headers,
         json=old_data,
     )
@@ -236,7 +259,7 @@ def test_update_password_me_incorrect_password(
     new_password = random_lower_string()
     data = {"current_password": new_password, "new_password": new_password}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me/password",
+        USERS_ME_PASSWORD_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -255,7 +278,7 @@ def test_update_user_me_email_exists(
 
     data = {"email": user.email}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me",
+        USERS_ME_URL,
         headers=normal_user_token_headers,
         json=data,
     )
@@ -271,7 +294,7 @@ def test_update_password_me_same_password_error(
         "new_password": settings.FIRST_SUPERUSER_PASSWORD,
     }
     r = client.patch(
-        f"{settings.API_V1_STR}/users/me/password",
+        USERS_ME_PASSWORD_URL,
         headers=superuser_token_headers,
         json=data,
     )
@@ -288,7 +311,7 @@ def test_register_user(client: TestClient, db: Session) -> None:
     full_name = random_lower_string()
     data = {"email": username, "password": password, "full_name": full_name}
     r = client.post(
-        f"{settings.API_V1_STR}/users/signup",
+        USERS_SIGNUP_URL,
         json=data,
     )
     assert r.status_code == 200
@@ -313,7 +336,7 @@ def test_register_user_already_exists_error(client: TestClient) -> None:
         "full_name": full_name,
     }
     r = client.post(
-        f"{settings.API_V1_STR}/users/signup",
+        USERS_SIGNUP_URL,
         json=data,
     )
     assert r.status_code == 400
@@ -330,7 +353,7 @@ def test_update_user(
 
     data = {"full_name": "Updated_full_name"}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/{user.id}",
+        f"{USERS_URL}{user.id}",
         headers=superuser_token_headers,
         json=data,
     )
@@ -351,7 +374,7 @@ def test_update_user_not_exists(
 ) -> None:
     data = {"full_name": "Updated_full_name"}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/{uuid.uuid4()}",
+        f"{USERS_URL}{MISSING_ID}",
         headers=superuser_token_headers,
         json=data,
     )
@@ -362,19 +385,15 @@ def test_update_user_not_exists(
 def test_update_user_email_exists(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    username = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=username, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
-
-    username2 = random_email()
-    password2 = random_lower_string()
-    user_in2 = UserCreate(email=username2, password=password2)
-    user2 = crud.create_user(session=db, user_create=user_in2)
+    users_in = [
+        UserCreate(email=random_email(), password=random_lower_string())
+        for _ in range(2)
+    ]
+    user, user2 = create_users(db, users_in)
 
     data = {"email": user2.email}
     r = client.patch(
-        f"{settings.API_V1_STR}/users/{user.id}",
+        f"{USERS_URL}{user.id}",
         headers=superuser_token_headers,
         json=data,
     )
@@ -389,17 +408,10 @@ def test_delete_user_me(client: TestClient, db: Session) -> None:
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
 
-    login_data = {
-        "username": username,
-        "password": password,
-    }
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
-    tokens = r.json()
-    a_token = tokens["access_token"]
-    headers = {"Authorization": f"Bearer {a_token}"}
+    headers = user_token_headers(user_id=user_id)
 
     r = client.delete(
-        f"{settings.API_V1_STR}/users/me",
+        USERS_ME_URL,
         headers=headers,
     )
     assert r.status_code == 200
@@ -417,7 +429,7 @@ def test_delete_user_me_as_superuser(
     client: TestClient, superuser_token_headers: dict[str, str]
 ) -> None:
     r = client.delete(
-        f"{settings.API_V1_STR}/users/me",
+        USERS_ME_URL,
         headers=superuser_token_headers,
     )
     assert r.status_code == 403
@@ -434,7 +446,7 @@ def test_delete_user_super_user(
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
     r = client.delete(
-        f"{settings.API_V1_STR}/users/{user_id}",
+        f"{USERS_URL}{user_id}",
         headers=superuser_token_headers,
     )
     assert r.status_code == 200
@@ -448,7 +460,7 @@ def test_delete_user_not_found(
     client: TestClient, superuser_token_headers: dict[str, str]
 ) -> None:
     r = client.delete(
-        f"{settings.API_V1_STR}/users/{uuid.uuid4()}",
+        f"{USERS_URL}{MISSING_ID}",
         headers=superuser_token_headers,
     )
     assert r.status_code == 404
@@ -463,7 +475,7 @@ def test_delete_user_current_super_user_error(
     user_id = super_user.id
 
     r = client.delete(
-        f"{settings.API_V1_STR}/users/{user_id}",
+        f"{USERS_URL}{user_id}",
         headers=superuser_token_headers,
     )
     assert r.status_code == 403
@@ -479,7 +491,7 @@ def test_delete_user_without_privileges(
     user = crud.create_user(session=db, user_create=user_in)
 
     r = client.delete(
-        f"{settings.API_V1_STR}/users/{user.id}",
+        f"{USERS_URL}{user.id}",
         headers=normal_user_token_headers,
     )
     assert r.status_code == 403
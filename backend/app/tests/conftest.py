@@ -1,42 +1,125 @@
+import os
 from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine
 
+from app.api.deps import get_db
+from app.core import security
 from app.core.config import settings
-from app.core.db import engine, init_db
+from app.core.db import engine as app_engine
+from app.core.db import init_db
 from app.main import app
-from app.models import Item, User
 from app.tests.utils.user import authentication_token_from_email
 from app.tests.utils.utils import get_superuser_token_headers
 
 
+def create_test_engine(url: str) -> Engine:
+    """
+    Create an engine for TEST_DATABASE_URL with the schema created directly.
+
+    For a fast run without Postgres, use an in-memory SQLite database, e.g.
+    TEST_DATABASE_URL="sqlite:///file:test?mode=memory&cache=shared&uri=true"
+    """
+    if not url.startswith("sqlite"):
+        test_engine = create_engine(url)
+        SQLModel.metadata.create_all(test_engine)
+        return test_engine
+
+    test_engine = create_engine(url, connect_args={"check_same_thread": False})
+
+    # pysqlite defers BEGIN until the first write, which breaks SAVEPOINTs used
+    # by the db fixture; take over transaction control so they nest properly
+    @event.listens_for(test_engine, "connect")
+    def do_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def do_begin(connection: Any) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(test_engine)
+    return test_engine
+
+
+test_database_url = os.environ.get("TEST_DATABASE_URL")
+engine = create_test_engine(test_database_url) if test_database_url else app_engine
+
+
+def get_engine_db() -> Generator[Session, None, None]:
+    with Session(engine) as session:
+        yield session
+
+
 @pytest.fixture(scope="session", autouse=True)
-def db() -> Generator[Session, None, None]:
+def fast_password_hashing() -> Generator[None, None, None]:
+    # bcrypt's default cost makes every hash and verify take hundreds of ms; tests
+    # only need real hashes that verify, so use the lowest cost bcrypt allows.
+    # Defined before init_test_db so the seeded superuser is hashed this way too.
+    with patch.object(
+        security, "pwd_context", security.pwd_context.copy(bcrypt__rounds=4)
+    ):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def smtp_send() -> Generator[MagicMock, None, None]:
+    # Tests that enable SMTP settings must never reach a real mail server
+    with patch("emails.Message.send") as send:
+        yield send
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_test_db() -> Generator[None, None, None]:
+    # Requests made outside of a test's db fixture, like the logins behind the
+    # token fixtures, must hit the same database as the tests
+    app.dependency_overrides[get_db] = get_engine_db
     with Session(engine) as session:
         init_db(session)
-        yield session
-        statement = delete(Item)
-        session.execute(statement)
-        statement = delete(User)
-        session.execute(statement)
-        session.commit()
+    # Tests roll back everything they write, and the seeded superuser and test
+    # user are found again on the next run, so there is nothing to delete
+    yield
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(autouse=True)
+def db() -> Generator[Session, None, None]:
+    # Each test runs inside one outer transaction that is rolled back at the end.
+    # Commits from tests and from request handlers only release a SAVEPOINT, and
+    # the app is served the same session so both sides see the same rows.
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+
+            def get_test_db() -> Session:
+                return session
+
+            app.dependency_overrides[get_db] = get_test_db
+            yield session
+            app.dependency_overrides[get_db] = get_engine_db
+        transaction.rollback()
+
+
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return get_superuser_token_headers(client)
 
 
-@pytest.fixture(scope="module")
-def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
-    return authentication_token_from_email(
-        client=client, email=settings.EMAIL_TEST_USER, db=db
-    )
+@pytest.fixture(scope="session")
+def normal_user_token_headers() -> dict[str, str]:
+    with Session(engine) as session:
+        return authentication_token_from_email(
+            email=settings.EMAIL_TEST_USER, db=session
+        )
@@ -1,4 +1,3 @@
-from fastapi.encoders import jsonable_encoder
 from sqlmodel import Session
 
 from app import crud
@@ -73,7 +72,7 @@ def test_get_user(db: Session) -> None:
     user_2 = db.get(User, user.id)
     assert user_2
     assert user.email == user_2.email
-    assert jsonable_encoder(user) == jsonable_encoder(user_2)
+    assert user.model_dump() == user_2.model_dump()
 
 
 def test_update_user(db: Session) -> None:
@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlmodel import Session, SQLModel, insert
+
+
+def bulk_insert(
+    db: Session, model: type[SQLModel], rows: Sequence[dict[str, Any]]
+) -> None:
+    """
+    Insert all rows with a single executemany.
+
+    Rows must carry every value the table needs, primary keys included, since
+    no ORM defaults are applied and nothing is refreshed afterwards. Nothing is
+    committed either: request handlers see the rows through the shared test
+    session and they are rolled back with the test.
+    """
+    db.execute(insert(model), rows)
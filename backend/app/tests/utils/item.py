@@ -1,16 +1,23 @@
 from sqlmodel import Session
 
-from app import crud
-from app.models import Item, ItemCreate
+from app.models import Item
 from app.tests.utils.user import create_random_user
 from app.tests.utils.utils import random_lower_string
 
 
 def create_random_item(db: Session) -> Item:
+    """
+    Create an item together with a new owner.
+
+    Both rows are only flushed; ids come from the models' default factories,
+    so no refresh is needed to link them.
+    """
     user = create_random_user(db)
-    owner_id = user.id
-    assert owner_id is not None
-    title = random_lower_string()
-    description = random_lower_string()
-    item_in = ItemCreate(title=title, description=description)
-    return crud.create_item(session=db, item_in=item_in, owner_id=owner_id)
+    item = Item(
+        title=random_lower_string(),
+        description=random_lower_string(),
+        owner_id=user.id,
+    )
+    db.add(item)
+    db.flush()
+    return item
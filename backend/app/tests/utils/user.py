@@ -1,49 +1,66 @@
-from fastapi.testclient import TestClient
+import uuid
+from collections.abc import Sequence
+from datetime import timedelta
+
 from sqlmodel import Session
 
 from app import crud
 from app.core.config import settings
-from app.models import User, UserCreate, UserUpdate
+from app.core.security import create_access_token, get_password_hash
+from app.models import User, UserCreate
 from app.tests.utils.utils import random_email, random_lower_string
 
 
-def user_authentication_headers(
-    *, client: TestClient, email: str, password: str
-) -> dict[str, str]:
-    data = {"username": email, "password": password}
+def user_token_headers(*, user_id: uuid.UUID) -> dict[str, str]:
+    """
+    Return auth headers with a token minted directly for the given user id.
 
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=data)
-    response = r.json()
-    auth_token = response["access_token"]
+    Skips the login endpoint and its password check for tests that only need
+    to act as the user.
+    """
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    auth_token = create_access_token(user_id, expires_delta=access_token_expires)
     headers = {"Authorization": f"Bearer {auth_token}"}
     return headers
 
 
 def create_random_user(db: Session) -> User:
-    email = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=email, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
+    # The id comes from the model's default factory, so skip the refresh that
+    # crud.create_user does to read back server-side state
+    user = User(
+        email=random_email(),
+        hashed_password=get_password_hash(random_lower_string()),
+    )
+    db.add(user)
+    db.flush()
     return user
 
 
-def authentication_token_from_email(
-    *, client: TestClient, email: str, db: Session
-) -> dict[str, str]:
+def create_users(db: Session, users_in: Sequence[UserCreate]) -> list[User]:
+    """
+    Create several users with a single flush.
+    """
+    users = [
+        User.model_validate(
+            user_in, update={"hashed_password": get_password_hash(user_in.password)}
+        )
+        for user_in in users_in
+    ]
+    db.add_all(users)
+    db.flush()
+    return users
+
+
+def authentication_token_from_email(*, email: str, db: Session) -> dict[str, str]:
     """
     Return a valid token for the user with given email.
 
-    If the user doesn't exist it is created first.
+    If the user doesn't exist it is created first. The token is minted
+    directly, so an existing user's password is left as it is.
     """
-    password = random_lower_string()
     user = crud.get_user_by_email(session=db, email=email)
     if not user:
-        user_in_create = UserCreate(email=email, password=password)
+        user_in_create = UserCreate(email=email, password=random_lower_string())
         user = crud.create_user(session=db, user_create=user_in_create)
-    else:
-        user_in_update = UserUpdate(password=password)
-        if not user.id:
-            raise Exception("User id not set")
-        user = crud.update_user(session=db, db_user=user, user_in=user_in_update)
 
-    return user_authentication_headers(client=client, email=email, password=password)
+    return user_token_headers(user_id=user.id)
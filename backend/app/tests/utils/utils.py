@@ -1,10 +1,16 @@
 import random
 import string
+import uuid
 
 from fastapi.testclient import TestClient
 
 from app.core.config import settings
 
+LOGIN_ACCESS_TOKEN_URL = f"{settings.API_V1_STR}/login/access-token"
+
+# Never assigned by uuid4, so lookups by this id always miss
+MISSING_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
 
 def random_lower_string() -> str:
     return "".join(random.choices(string.ascii_lowercase, k=32))
@@ -19,7 +25,7 @@ def get_superuser_token_headers(client: TestClient) -> dict[str, str]:
         "username": settings.FIRST_SUPERUSER,
         "password": settings.FIRST_SUPERUSER_PASSWORD,
     }
-    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+    r = client.post(LOGIN_ACCESS_TOKEN_URL, data=login_data)
     tokens = r.json()
     a_token = tokens["access_token"]
     headers = {"Authorization": f"Bearer {a_token}"}
@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,11 +23,17 @@ class EmailData:
     subject: str
 
 
-def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
+@lru_cache
+def get_email_template(template_name: str) -> Template:
     template_str = (
         Path(__file__).parent / "email-templates" / "build" / template_name
     ).read_text()
-    html_content = Template(template_str).render(context)
+    template: Template = Template(template_str)
+    return template
+
+
+def render_email_template(*, template_name: str, context: dict[str, Any]) -> str:
+    html_content = get_email_template(template_name).render(context)
     return html_content
 
 